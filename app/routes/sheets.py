@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import APIRouter, Request, Depends, Form
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from app.routes.auth import require_auth
+from app.services import history_store
 import os
+import logging
 import requests
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
@@ -13,6 +15,7 @@ from firebase_admin import firestore
 router = APIRouter()
 db = firestore.client()
 templates = Jinja2Templates(directory="app/templates")
+logger = logging.getLogger("sheets")
 
 # -----------------------
 # Google API Setup
@@ -302,8 +305,57 @@ async def check_all_user_sheets():
                 "updated": updated
             })
 
+    checked_at = datetime.now(timezone.utc)
+
+    # Keep a local record of this sweep for analytics
+    try:
+        history_store.record_sweep(processed_sheets, checked_at)
+    except Exception as e:
+        logger.exception(f"Failed to record sweep in history store: {str(e)}")
+
     return JSONResponse({
-        "checked_at": datetime.utcnow().isoformat(),
+        "checked_at": checked_at.isoformat(),
         "total_sheets_processed": len(processed_sheets),
         "sheets": processed_sheets
     })
+
+
+# -----------------------
+# Sweep analytics (local history store)
+# -----------------------
+@router.get("/dashboard/analytics/edit_frequency")
+async def edit_frequency(days: int = 30, user: dict = Depends(require_auth)):
+    days = max(1, min(days, 365))
+    return JSONResponse({
+        "days": days,
+        "data_since": history_store.get_data_since(user.get("uid")),
+        "sheets": history_store.get_edit_frequency(user.get("uid"), days)
+    })
+
+@router.get("/dashboard/analytics/uptime")
+async def uptime(days: int = 30, user: dict = Depends(require_auth)):
+    days = max(1, min(days, 365))
+    return JSONResponse({
+        "days": days,
+        "data_since": history_store.get_data_since(user.get("uid")),
+        "sheets": history_store.get_uptime(user.get("uid"), days)
+    })
+
+@router.get("/dashboard/analytics/daily")
+async def daily_series(days: int = 30, sheet_id: str | None = None, user: dict = Depends(require_auth)):
+    days = max(1, min(days, 365))
+    return JSONResponse({
+        "days": days,
+        "data_since": history_store.get_data_since(user.get("uid")),
+        "sheet_id": sheet_id,
+        "series": history_store.get_daily_series(user.get("uid"), days, sheet_id)
+    })
+
+@router.get("/dashboard/analytics/checks")
+async def recent_checks(sheet_id: str, hours: int = 24, user: dict = Depends(require_auth)):
+    hours = max(1, min(hours, history_store.RAW_RETENTION_DAYS * 24))
+    return JSONResponse({
+        "sheet_id": sheet_id,
+        "hours": hours,
+        "checks": history_store.get_recent_checks(user.get("uid"), sheet_id, hours)
+    })
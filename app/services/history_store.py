@@ -0,0 +1,189 @@
+import calendar
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+# -----------------------
+# Local sweep history store
+# -----------------------
+# SQLite record of every sheet check done by the sweep. sweep_results holds
+# one row per check (reachability and whether an edit was detected) and is
+# pruned to the last RAW_RETENTION_DAYS on every sweep. sweep_daily is the
+# downsampled per-day rollup and is kept forever, so long-range charts stay
+# cheap.
+#
+# HISTORY_DB_PATH must point at a persistent disk mount in production. On a
+# host with an ephemeral filesystem the database is wiped on every deploy or
+# restart, and the analytics would only cover the time since then. The
+# endpoints report `data_since` so a short window is visible to callers.
+DB_PATH = os.getenv("HISTORY_DB_PATH", "app/data/sweep_history.db")
+RAW_RETENTION_DAYS = int(os.getenv("HISTORY_RAW_RETENTION_DAYS", "7"))
+
+_lock = threading.Lock()
+_conn = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweep_results (
+    ts INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    sheet_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT NOT NULL,
+    updated INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_ts ON sweep_results (ts);
+CREATE INDEX IF NOT EXISTS idx_results_uid_sheet_ts ON sweep_results (uid, sheet_id, ts);
+
+CREATE TABLE IF NOT EXISTS sweep_daily (
+    day TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    sheet_id TEXT NOT NULL,
+    name TEXT,
+    checks INTEGER NOT NULL DEFAULT 0,
+    reachable_checks INTEGER NOT NULL DEFAULT 0,
+    updates INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, uid, sheet_id)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_uid_day ON sweep_daily (uid, day);
+"""
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(DB_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.executescript(SCHEMA)
+    return _conn
+
+
+def _to_epoch(dt: datetime) -> int:
+    # timegm treats naive datetimes as UTC, unlike datetime.timestamp()
+    return calendar.timegm(dt.utctimetuple())
+
+
+def _since_day(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+
+
+def record_sweep(results: list[dict], checked_at: datetime | None = None):
+    """Store one sweep's results, fold them into the daily rollup and prune old raw rows."""
+    if not results:
+        return
+    checked_at = checked_at or datetime.now(timezone.utc)
+    ts = _to_epoch(checked_at)
+    day = datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d")
+
+    raw_rows = []
+    daily_rows = []
+    for r in results:
+        reachable = 1 if r.get("status") == "reachable" else 0
+        updated = 1 if r.get("updated") else 0
+        raw_rows.append((ts, day, r["uid"], r["sheet_id"], r.get("name"), r.get("status"), updated))
+        daily_rows.append((day, r["uid"], r["sheet_id"], r.get("name"), reachable, updated))
+
+    cutoff = ts - RAW_RETENTION_DAYS * 86400
+
+    with _lock:
+        conn = _get_conn()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO sweep_results (ts, day, uid, sheet_id, name, status, updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                raw_rows
+            )
+            conn.executemany(
+                """
+                INSERT INTO sweep_daily (day, uid, sheet_id, name, checks, reachable_checks, updates)
+                VALUES (?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT (day, uid, sheet_id) DO UPDATE SET
+                    name = excluded.name,
+                    checks = checks + 1,
+                    reachable_checks = reachable_checks + excluded.reachable_checks,
+                    updates = updates + excluded.updates
+                """,
+                daily_rows
+            )
+            # Downsample: raw rows past retention only live on in sweep_daily
+            conn.execute("DELETE FROM sweep_results WHERE ts < ?", (cutoff,))
+
+
+def _query(sql: str, params: tuple):
+    with _lock:
+        return [dict(row) for row in _get_conn().execute(sql, params).fetchall()]
+
+
+def get_data_since(uid: str) -> str | None:
+    """Oldest day with recorded checks for this user, or None if there are none."""
+    rows = _query("SELECT MIN(day) AS day FROM sweep_daily WHERE uid = ?", (uid,))
+    return rows[0]["day"] if rows else None
+
+
+def get_edit_frequency(uid: str, days: int = 30):
+    """Number of detected edits per sheet over the last `days` days."""
+    return _query(
+        """
+        SELECT sheet_id, MAX(name) AS name, SUM(updates) AS edits, SUM(checks) AS checks
+        FROM sweep_daily
+        WHERE uid = ? AND day >= ?
+        GROUP BY sheet_id
+        ORDER BY edits DESC
+        """,
+        (uid, _since_day(days))
+    )
+
+
+def get_uptime(uid: str, days: int = 30):
+    """Share of checks where each sheet was reachable over the last `days` days."""
+    rows = _query(
+        """
+        SELECT sheet_id, MAX(name) AS name, SUM(checks) AS checks,
+               SUM(reachable_checks) AS reachable_checks
+        FROM sweep_daily
+        WHERE uid = ? AND day >= ?
+        GROUP BY sheet_id
+        ORDER BY name
+        """,
+        (uid, _since_day(days))
+    )
+    for row in rows:
+        row["uptime"] = round(row["reachable_checks"] / row["checks"], 4) if row["checks"] else None
+    return rows
+
+
+def get_daily_series(uid: str, days: int = 30, sheet_id: str | None = None):
+    """Per-day totals for charts, optionally narrowed to one sheet."""
+    sql = """
+        SELECT day, SUM(checks) AS checks, SUM(reachable_checks) AS reachable_checks,
+               SUM(updates) AS edits
+        FROM sweep_daily
+        WHERE uid = ? AND day >= ?
+    """
+    params = [uid, _since_day(days)]
+    if sheet_id:
+        sql += " AND sheet_id = ?"
+        params.append(sheet_id)
+    sql += " GROUP BY day ORDER BY day"
+    return _query(sql, tuple(params))
+
+
+def get_recent_checks(uid: str, sheet_id: str, hours: int = 24):
+    """Raw per-check points for one sheet, limited by RAW_RETENTION_DAYS."""
+    since = _to_epoch(datetime.now(timezone.utc)) - hours * 3600
+    return _query(
+        """
+        SELECT ts, status, updated
+        FROM sweep_results
+        WHERE uid = ? AND sheet_id = ? AND ts >= ?
+        ORDER BY ts
+        """,
+        (uid, sheet_id, since)
+    )
@@ -0,0 +1,91 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import history_store
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    # Non-UTC local time catches naive datetime.timestamp() mistakes
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    monkeypatch.setattr(history_store, "DB_PATH", str(tmp_path / "history.db"))
+    monkeypatch.setattr(history_store, "_conn", None)
+    yield history_store
+    if history_store._conn is not None:
+        history_store._conn.close()
+    monkeypatch.undo()
+    time.tzset()
+
+
+def sweep(status="reachable", updated=False, sheet_id="s1"):
+    return [{"uid": "u1", "sheet_id": sheet_id, "name": sheet_id, "status": status, "updated": updated}]
+
+
+def rows(sql):
+    return history_store._query(sql, ())
+
+
+def test_timestamp_is_utc_epoch():
+    checked_at = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+    history_store.record_sweep(sweep(), checked_at)
+    history_store.record_sweep(sweep(), checked_at.replace(tzinfo=None))
+
+    assert rows("SELECT ts, day FROM sweep_results") == [
+        {"ts": int(checked_at.timestamp()), "day": "2026-10-19"},
+    ] * 2
+
+
+def test_rollup_counts_two_sweeps_same_day():
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0)
+    history_store.record_sweep(sweep(updated=True), now - timedelta(seconds=60))
+    history_store.record_sweep(sweep(status="unreachable"), now)
+
+    daily = rows("SELECT checks, reachable_checks, updates FROM sweep_daily")
+    assert daily == [{"checks": 2, "reachable_checks": 1, "updates": 1}]
+
+    assert history_store.get_edit_frequency("u1") == [
+        {"sheet_id": "s1", "name": "s1", "edits": 1, "checks": 2},
+    ]
+
+
+def test_retention_prunes_raw_rows_but_keeps_rollup():
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=history_store.RAW_RETENTION_DAYS + 1)
+    history_store.record_sweep(sweep(updated=True), old)
+    history_store.record_sweep(sweep(), now)
+
+    assert rows("SELECT COUNT(*) AS n FROM sweep_results") == [{"n": 1}]
+    assert rows("SELECT COUNT(*) AS n FROM sweep_daily") == [{"n": 2}]
+    assert history_store.get_data_since("u1") == old.strftime("%Y-%m-%d")
+
+
+def test_days_window_excludes_older_rollups():
+    now = datetime.now(timezone.utc)
+    history_store.record_sweep(sweep(updated=True), now - timedelta(days=40))
+    history_store.record_sweep(sweep(), now)
+
+    assert [d["day"] for d in history_store.get_daily_series("u1", 30)] == [now.strftime("%Y-%m-%d")]
+    assert len(history_store.get_daily_series("u1", 60)) == 2
+
+
+def test_uptime_ratio():
+    now = datetime.now(timezone.utc)
+    for i, status in enumerate(["reachable", "reachable", "reachable", "unreachable"]):
+        history_store.record_sweep(sweep(status=status), now - timedelta(seconds=i))
+
+    [row] = history_store.get_uptime("u1")
+    assert row["checks"] == 4
+    assert row["reachable_checks"] == 3
+    assert row["uptime"] == 0.75
+
+
+def test_recent_checks_reads_raw_rows():
+    now = datetime.now(timezone.utc)
+    history_store.record_sweep(sweep(updated=True), now - timedelta(hours=30))
+    history_store.record_sweep(sweep(), now)
+
+    checks = history_store.get_recent_checks("u1", "s1", hours=24)
+    assert [c["updated"] for c in checks] == [0]